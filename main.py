@@ -4,9 +4,12 @@ from discord import app_commands
 from discord.ui import View, Select
 import json
 import os
+import re
 import asyncio
 import aiohttp
+import time
 import base64
+import sqlite3
 import zipfile
 from io import BytesIO
 import requests
@@ -29,6 +32,7 @@ translator = Translator()
 
 thread_timers = defaultdict(lambda: None)
 translation_threads = {}
+translation_stats = defaultdict(int)
 
 # Configure Gemini
 genai.configure(api_key=GOOGLE_GENAI_KEY)
@@ -42,6 +46,76 @@ intents.reactions = True
 bot = commands.Bot(command_prefix="!", intents=intents)
 tree = bot.tree
 
+# --- Outbound action queue ---
+class OutboundQueue:
+    # Sends, deletes and thread member adds are queued per Discord route (the method plus the
+    # channel it targets), so calls sharing a rate-limit bucket run one at a time in order while
+    # different routes proceed in parallel under a global cap. Callers never wait on the queue.
+    def __init__(self, max_concurrency=4):
+        self.queues = {}
+        self.workers = {}
+        self.max_concurrency = max_concurrency
+        self.semaphore = None
+        self.pending_members = defaultdict(set)
+
+    def enqueue(self, route, action):
+        # The semaphore is created on first use so it belongs to the loop bot.run() starts
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        future = asyncio.get_running_loop().create_future()
+        self.queues.setdefault(route, asyncio.Queue()).put_nowait((action, future))
+        worker = self.workers.get(route)
+        if not worker or worker.done():
+            self.workers[route] = asyncio.create_task(self.run_route(route))
+        return future
+
+    async def run_route(self, route):
+        queue = self.queues[route]
+        while not queue.empty():
+            action, future = queue.get_nowait()
+            async with self.semaphore:
+                try:
+                    result = await action()
+                except Exception as e:
+                    print(f"⚠️ Outbound {route[0]} on {route[1]} failed: {e}")
+                    result = None
+            if not future.done():
+                future.set_result(result)
+        # Nothing can be queued between the empty check and here, so the route can be dropped
+        del self.queues[route]
+        del self.workers[route]
+
+    def send(self, channel, *args, **kwargs):
+        return self.enqueue(("send", channel.id), lambda: channel.send(*args, **kwargs))
+
+    def delete_later(self, target, delay, action=None):
+        # Returns a handle whose cancel() drops the delete if it has not been queued yet
+        if isinstance(target, discord.Message):
+            route = ("delete_message", target.channel.id)
+        else:
+            route = ("delete_channel", target.id)
+        return asyncio.get_running_loop().call_later(delay, self.enqueue, route, action or target.delete)
+
+    def add_thread_member(self, thread, user):
+        # Adding the user notifies them like a ping would. add_user is idempotent, so only an add
+        # that is still waiting in the queue is coalesced; users who left get added again.
+        if user.id in self.pending_members[thread.id]:
+            return None
+
+        async def add():
+            try:
+                await thread.add_user(user)
+                print(f"👋 Added {user.name} to thread {thread.name}")
+            finally:
+                self.pending_members[thread.id].discard(user.id)
+                if not self.pending_members[thread.id]:
+                    del self.pending_members[thread.id]
+
+        self.pending_members[thread.id].add(user.id)
+        return self.enqueue(("thread_member", thread.id), add)
+
+outbound = OutboundQueue()
+
 # --- Persistent storage files ---
 LEVEL_FILE = "role_levels.json"
 ANNOUNCE_FILE = "announce_channels.json"
@@ -99,6 +173,170 @@ def is_flag_emoji(emoji):
 def emoji_to_country_code(emoji):
     return ''.join([chr(ord(c) - 127397) for c in emoji])
 
+def forget_translation_thread(thread_id):
+    timer = thread_timers.pop(thread_id, None)
+    if timer:
+        timer.cancel()
+    for key in [key for key, t in translation_threads.items() if t.id == thread_id]:
+        del translation_threads[key]
+
+def build_translation_prompt(lang_code, content):
+    return f"Only output the single best answer for this prompt. Do not output anything else. " \
+           f"Understand that the content of the prompt may be in slang and need to be " \
+           f"completed for an accurate translation." \
+           f"Translate this to the native language of the country with the ISO code {lang_code} " \
+           f"(formal and clear):\"{content}\""
+
+TRANSLATION_CHUNK_SIZE = 1200
+DISCORD_MESSAGE_LIMIT = 2000
+
+def hard_split(text, limit):
+    # Last resort for a single line longer than the limit: cut on whitespace where possible
+    pieces = []
+    while len(text) > limit:
+        cut = text.rfind(" ", 0, limit)
+        if cut <= 0:
+            cut = limit
+        pieces.append(text[:cut])
+        text = text[cut:].lstrip(" ")
+    if text:
+        pieces.append(text)
+    return pieces
+
+def chunk_message(text, limit=DISCORD_MESSAGE_LIMIT):
+    chunks = []
+    current = ""
+    for line in text.split("\n"):
+        for piece in (hard_split(line, limit) if len(line) > limit else [line]):
+            if current and len(current) + len(piece) + 1 > limit:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f"{current}\n{piece}" if current else piece
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+def split_paragraphs(text, limit=TRANSLATION_CHUNK_SIZE):
+    # Group whole paragraphs into chunks so each translation request keeps its context
+    chunks = []
+    current = ""
+    for paragraph in text.split("\n\n"):
+        if not paragraph.strip():
+            continue
+        if len(paragraph) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.extend(chunk_message(paragraph, limit))
+        elif current and len(current) + len(paragraph) + 2 > limit:
+            chunks.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks
+
+# --- Local translation pre-check ---
+COUNTRY_LANGUAGES = {
+    "US": "en", "GB": "en", "AU": "en", "CA": "en", "NZ": "en", "IE": "en",
+    "ES": "es", "MX": "es", "AR": "es", "CO": "es", "CL": "es", "PE": "es",
+    "FR": "fr", "BE": "fr", "DE": "de", "AT": "de", "CH": "de",
+    "PT": "pt", "BR": "pt", "IT": "it", "NL": "nl",
+    "JP": "ja", "KR": "ko", "CN": "zh-Hans", "TW": "zh-Hant", "HK": "zh-Hant",
+    "IL": "he", "GR": "el", "TH": "th",
+}
+
+# Only scripts written by a single language; Cyrillic, Arabic, Devanagari etc. are left to the model
+SCRIPT_LANGUAGES = [
+    ("ja", [(0x3040, 0x30FF)]),
+    ("ko", [(0xAC00, 0xD7AF), (0x1100, 0x11FF)]),
+    ("zh", [(0x4E00, 0x9FFF)]),
+    ("he", [(0x0590, 0x05FF)]),
+    ("el", [(0x0370, 0x03FF)]),
+    ("th", [(0x0E00, 0x0E7F)]),
+]
+
+# Only words that are not also common words in another of these languages. A false skip hides
+# the translation entirely, so anything ambiguous (il, non, es, du, da, con, lo, das, was...) is left out.
+LATIN_STOPWORDS = {
+    "en": {"the", "and", "you", "that", "this", "with", "have", "they", "what", "there", "would", "should", "your", "just"},
+    "es": {"el", "los", "las", "pero", "muy", "esto", "también", "yo", "hay", "usted", "cuando", "ahora", "nosotros", "donde", "tengo", "ellos"},
+    "fr": {"les", "des", "est", "une", "pour", "dans", "pas", "avec", "vous", "nous", "mais", "sont", "elle", "aussi", "très", "cette", "ils"},
+    "de": {"der", "und", "ist", "nicht", "ein", "eine", "ich", "mit", "wir", "sie", "auf", "für", "auch", "kann", "sind", "wird", "haben", "sehr"},
+    "pt": {"os", "um", "uma", "não", "você", "são", "isso", "muito", "também", "eu", "ela", "ainda", "então", "obrigado"},
+    "it": {"gli", "che", "sono", "della", "questo", "anche", "molto", "perché", "ciao", "grazie", "hai", "cosa"},
+    "nl": {"het", "een", "dat", "niet", "ik", "voor", "zijn", "wij", "ook", "maar", "heb", "jij", "wat"},
+}
+
+# Common characters whose Simplified and Traditional forms differ
+SIMPLIFIED_CHINESE = set("们这个来时为说国会对后过还没么门见问长话让给经发现开关")
+TRADITIONAL_CHINESE = set("們這個來時為說國會對後過還沒麼門見問長話讓給經發現開關")
+
+UNTRANSLATABLE_PATTERN = re.compile(
+    r"```.*?```|`[^`]*`|https?://\S+|<a?:\w+:\d+>|<[@#][!&]?\d+>|<t:\d+(?::\w)?>",
+    re.DOTALL
+)
+
+def detect_language(text):
+    letters = [c for c in text if c.isalpha()]
+    if not letters:
+        return None
+
+    counts = {lang: sum(1 for c in letters if any(lo <= ord(c) <= hi for lo, hi in ranges))
+              for lang, ranges in SCRIPT_LANGUAGES}
+    # Kanji share the CJK block with Chinese; any kana means Japanese
+    if counts["ja"]:
+        counts["ja"] += counts.pop("zh")
+    lang, count = max(counts.items(), key=lambda item: item[1])
+    if count > len(letters) / 2:
+        if lang == "zh":
+            simplified = any(c in SIMPLIFIED_CHINESE for c in letters)
+            traditional = any(c in TRADITIONAL_CHINESE for c in letters)
+            if simplified == traditional:
+                return None
+            return "zh-Hans" if simplified else "zh-Hant"
+        return lang
+
+    # Stopwords only mean something for Latin-script text
+    if sum(1 for c in letters if ord(c) < 0x0250) <= len(letters) / 2:
+        return None
+
+    words = re.findall(r"[^\W\d_]+", text.lower())
+    hits = {lang: sum(1 for w in words if w in stopwords) for lang, stopwords in LATIN_STOPWORDS.items()}
+    ranked = sorted(hits.items(), key=lambda item: item[1], reverse=True)
+    (lang, count), (_, runner_up) = ranked[0], ranked[1]
+    # Anything short of a clear win goes to the model
+    if count >= 2 and count >= len(words) * 0.15 and count >= 2 * runner_up:
+        return lang
+    return None
+
+def precheck_translation(content, lang_code):
+    # Returns why a model call can be skipped, or None if the content needs translating
+    remaining = UNTRANSLATABLE_PATTERN.sub(" ", content)
+    if not any(c.isalpha() for c in remaining):
+        return "untranslatable"
+    target = COUNTRY_LANGUAGES.get(lang_code)
+    if target and detect_language(remaining) == target:
+        return "same_language"
+    return None
+
+def record_skipped_translation(reason, saved_calls=1):
+    translation_stats[f"skipped_{reason}"] += 1
+    translation_stats["model_calls_saved"] += saved_calls
+
+def precheck_notice(reason, emoji_name, lang_code):
+    if reason == "same_language":
+        return f"ℹ️ This message is already in the language for {emoji_name} / {lang_code}, no translation needed."
+    return "ℹ️ Nothing to translate here (only links, emoji, mentions or code)."
+
+async def translate_text(content, lang_code):
+    # Async variant so several translations can be in flight without blocking the event loop
+    translation_stats["model_calls"] += 1
+    response = await gemini_model.generate_content_async(build_translation_prompt(lang_code, content))
+    return response.text.strip()
+
 @bot.command()
 @commands.has_permissions(administrator=True)
 async def translateconfig(ctx, action: str, channel: discord.TextChannel):
@@ -123,6 +361,16 @@ async def translateconfig(ctx, action: str, channel: discord.TextChannel):
     else:
         await ctx.send("⚠️ Usage: `!translateconfig <add/remove> #channel`")
 
+@bot.command()
+@commands.has_permissions(administrator=True)
+async def translatestats(ctx):
+    await ctx.send(
+        f"🌐 Model calls made: `{translation_stats['model_calls']}`\n"
+        f"⏭️ Model calls saved: `{translation_stats['model_calls_saved']}` "
+        f"(already in target language: `{translation_stats['skipped_same_language']}`, "
+        f"nothing to translate: `{translation_stats['skipped_untranslatable']}`)"
+    )
+
 @bot.command()
 @commands.has_permissions(administrator=True)
 async def rolelevel(ctx, role: discord.Role, level: int):
@@ -155,40 +403,53 @@ async def on_raw_reaction_add(payload):
         thread_key = (message.id, lang_code)
 
         if thread_key in translation_threads:
-            thread = translation_threads[thread_key]
-            try:
-                ping = await thread.send(f"{user.mention}")
-                await asyncio.sleep(1)
-                await ping.delete()
-                print(f"👋 Pinged {user.name} in existing thread.")
-            except Exception as e:
-                print(f"⚠️ Failed to ping in thread: {e}")
+            outbound.add_thread_member(translation_threads[thread_key], user)
             return
 
-        prompt = f"Only output the single best answer for this prompt. Do not output anything else. " \
-                 f"Understand that the content of the prompt may be in slang and need to be " \
-                 f"completed for an accurate translation." \
-                 f"Translate this to the native language of the country with the ISO code {lang_code} " \
-                 f"(formal and clear):\"{message.content}\""
-
-        print(f"🌐 Prompt: {prompt}")
-        response = gemini_model.generate_content(prompt)
-        translated = response.text.strip()
-
-        thread = await channel.create_thread(
-            name=f"[{lang_code}] Translation of Msg {message.id}",
-            type=discord.ChannelType.private_thread,
-            auto_archive_duration=60,
-            invitable=False
-        )
-
-        await thread.send(f"📄 Original message:\n{message.content}")
-        await thread.send(f"🌍 Translation ({emoji_name} / {lang_code}):\n{translated}")
-        ping = await thread.send(f"{user.mention}")
-        await asyncio.sleep(1)
-        await ping.delete()
+        # Start every paragraph chunk translating at once; results are posted in order as they land
+        pieces = split_paragraphs(message.content)
+        skip_reason = precheck_translation(message.content, lang_code)
+        if skip_reason:
+            record_skipped_translation(skip_reason, len(pieces))
+            print(f"⏭️ Skipped translation to {lang_code}: {skip_reason}")
+            pieces = []
+        else:
+            print(f"🌐 Translating {len(message.content)} chars to {lang_code} in {len(pieces)} chunk(s)")
+        tasks = [asyncio.create_task(translate_text(piece, lang_code)) for piece in pieces]
 
-        translation_threads[thread_key] = thread
+        try:
+            thread = await channel.create_thread(
+                name=f"[{lang_code}] Translation of Msg {message.id}",
+                type=discord.ChannelType.private_thread,
+                auto_archive_duration=60,
+                invitable=False
+            )
+            translation_threads[thread_key] = thread
+            outbound.add_thread_member(thread, user)
+
+            # Sends share one FIFO route per thread, so they stay in order without awaiting each one
+            for chunk in chunk_message(f"📄 Original message:\n{message.content}"):
+                outbound.send(thread, chunk)
+
+            if skip_reason:
+                outbound.send(thread, precheck_notice(skip_reason, emoji_name, lang_code))
+
+            header = f"🌍 Translation ({emoji_name} / {lang_code}):\n"
+            for number, task in enumerate(tasks, start=1):
+                try:
+                    translated = await task
+                except Exception as e:
+                    print(f"⚠️ Translation of part {number} to {lang_code} failed: {e}")
+                    outbound.send(thread, f"⚠️ Translation of part {number} failed.")
+                    continue
+                for chunk in chunk_message(header + translated):
+                    outbound.send(thread, chunk)
+                header = ""
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     except Exception as e:
         print(f"❌ Error in on_raw_reaction_add: {e}")
@@ -201,16 +462,23 @@ async def on_message(message):
         if thread_timers[thread.id]:
             thread_timers[thread.id].cancel()
 
-        async def delete_after_inactive():
-            await asyncio.sleep(3600)
+        async def delete_inactive():
             try:
                 await thread.delete()
                 print(f"🧹 Deleted inactive thread: {thread.name}")
+            except discord.NotFound:
+                print(f"🧹 Inactive thread was already deleted: {thread.name}")
             except Exception as e:
                 print(f"⚠️ Could not delete thread: {e}")
+                return
+            forget_translation_thread(thread.id)
+
+        # Delete after an hour of inactivity; each new message pushes the deadline back
+        thread_timers[thread.id] = outbound.delete_later(thread, 3600, delete_inactive)
 
-        task = bot.loop.create_task(delete_after_inactive())
-        thread_timers[thread.id] = task
+    if is_indexed_forum_thread(message.channel):
+        ensure_thread_meta(message.channel)
+        index_message(message)
 
     await bot.process_commands(message)
 
@@ -230,38 +498,38 @@ async def announceconfig(ctx, channel: discord.TextChannel):
     save_announce_channels()
     await ctx.send(f"Announcement channel set to {channel.mention}")
 
+async def resolve_source_message(ctx, message_link):
+    if message_link:
+        parts = message_link.strip().split('/')
+        channel_id = int(parts[-2])
+        message_id = int(parts[-1])
+        source_channel = bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
+        return await source_channel.fetch_message(message_id)
+    elif ctx.message.reference:
+        ref = ctx.message.reference.resolved
+        if isinstance(ref, discord.Message):
+            return ref
+        raise ValueError("Couldn't read replied message.")
+    await ctx.send("⚠️ Please provide a message link or reply to a message.")
+    return None
+
 @bot.command()
 @requires_level(9)
 async def announce(ctx, target_channel: discord.TextChannel, flag_emoji: str = '🇺🇸', message_link: str = None):
     try:
         # Identify the source message
-        if message_link:
-            parts = message_link.strip().split('/')
-            channel_id = int(parts[-2])
-            message_id = int(parts[-1])
-            source_channel = bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
-            message = await source_channel.fetch_message(message_id)
-        elif ctx.message.reference:
-            ref = ctx.message.reference.resolved
-            if isinstance(ref, discord.Message):
-                message = ref
-            else:
-                raise ValueError("Couldn't read replied message.")
-        else:
-            await ctx.send("⚠️ Please provide a message link or reply to a message.")
+        message = await resolve_source_message(ctx, message_link)
+        if not message:
             return
         # Translate if valid flag emoji
         content = message.content if message.content else None
-        if content and len(flag_emoji) == 2 and all(0x1F1E6 <= ord(c) <= 0x1F1FF for c in flag_emoji) and \
-                flag_emoji != '🇺🇸':
-            lang_code = ''.join([chr(ord(c) - 127397) for c in flag_emoji])
-            prompt = f"Only output the single best answer for this prompt. Do not output anything else. " \
-                     f"Understand that the content of the prompt may be in slang and need to be " \
-                     f"completed for an accurate translation." \
-                     f"Translate this to the native language of the country with the ISO code {lang_code} " \
-                     f"(formal and clear):\"{content}\""
-            response = gemini_model.generate_content(prompt)
-            content = response.text.strip()
+        if content and is_flag_emoji(flag_emoji) and flag_emoji != '🇺🇸':
+            lang_code = emoji_to_country_code(flag_emoji)
+            skip_reason = precheck_translation(content, lang_code)
+            if skip_reason:
+                record_skipped_translation(skip_reason)
+            else:
+                content = await translate_text(content, lang_code)
 
         files = [await a.to_file() for a in message.attachments]
         embeds = message.embeds if message.embeds else None
@@ -272,6 +540,119 @@ async def announce(ctx, target_channel: discord.TextChannel, flag_emoji: str = '
     except Exception as e:
         await ctx.send(f"❌ Error: {e}")
 
+ANNOUNCE_FANOUT_CONCURRENCY = 5
+
+def chunk_lines(lines, header=""):
+    # Break large reports into chunks of 2000 characters or less
+    chunks = []
+    current_chunk = header
+    for line in lines:
+        if len(current_chunk) + len(line) + 1 > 2000:
+            chunks.append(current_chunk)
+            current_chunk = ""
+        current_chunk += line + "\n"
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+async def resolve_channel_target(ctx, token):
+    # Targets may live in other guilds, so the invoker must be able to post there themselves
+    channel_id = int(token.strip("<#>"))
+    channel = bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
+    guild = getattr(channel, "guild", None)
+    if not guild:
+        raise PermissionError("not a server channel")
+    try:
+        member = guild.get_member(ctx.author.id) or await guild.fetch_member(ctx.author.id)
+    except discord.NotFound:
+        raise PermissionError(f"you are not a member of {guild.name}")
+    permissions = channel.permissions_for(member)
+    if not permissions.send_messages:
+        raise PermissionError(f"you cannot send messages in #{channel.name}")
+    return channel, permissions
+
+@bot.command()
+@requires_level(9)
+async def announce_multi(ctx, *args: str):
+    # !announce_multi [message link] #channel [flag] <channel id> [flag] ... (IDs may be in other guilds)
+    try:
+        message_link = None
+        if args and args[0].startswith("http"):
+            message_link, args = args[0], args[1:]
+        message = await resolve_source_message(ctx, message_link)
+        if not message:
+            return
+
+        # Each channel token may be followed by the flag of the language it should receive
+        targets = []
+        for token in args:
+            if is_flag_emoji(token) and targets:
+                targets[-1][1] = token
+            else:
+                targets.append([token, '🇺🇸'])
+        if not targets:
+            await ctx.send("⚠️ Usage: `!announce_multi [message link] #channel [flag] #channel [flag] ...`")
+            return
+
+        start = time.perf_counter()
+        content = message.content if message.content else None
+        embeds = message.embeds if message.embeds else None
+
+        # Download every attachment once; each send wraps the shared bytes in its own File
+        attachment_data = await asyncio.gather(*(a.read() for a in message.attachments))
+        attachments = [(a.filename, data, a.is_spoiler()) for a, data in zip(message.attachments, attachment_data)]
+
+        # Translate each distinct language once, all at the same time
+        lang_codes = list({
+            emoji_to_country_code(flag) for _, flag in targets
+            if content and is_flag_emoji(flag) and flag != '🇺🇸'
+        })
+        translations = {}
+        for code in lang_codes:
+            skip_reason = precheck_translation(content, code)
+            if skip_reason:
+                record_skipped_translation(skip_reason)
+                translations[code] = content
+        lang_codes = [code for code in lang_codes if code not in translations]
+        translated = await asyncio.gather(*(translate_text(content, code) for code in lang_codes),
+                                          return_exceptions=True)
+        translations.update(zip(lang_codes, translated))
+
+        semaphore = asyncio.Semaphore(ANNOUNCE_FANOUT_CONCURRENCY)
+
+        async def deliver(token, flag):
+            async with semaphore:
+                try:
+                    channel, permissions = await resolve_channel_target(ctx, token)
+                    text = content
+                    if content and is_flag_emoji(flag) and flag != '🇺🇸':
+                        text = translations[emoji_to_country_code(flag)]
+                        if isinstance(text, Exception):
+                            raise text
+                    files = [discord.File(BytesIO(data), filename=name, spoiler=spoiler)
+                             for name, data, spoiler in attachments]
+                    allowed_mentions = discord.AllowedMentions(
+                        everyone=permissions.mention_everyone,
+                        roles=permissions.mention_everyone,
+                        users=True
+                    )
+                    await channel.send(content=text, files=files, embeds=embeds,
+                                       allowed_mentions=allowed_mentions)
+                    status = f"✅ {channel.mention} ({flag})"
+                except Exception as e:
+                    status = f"❌ `{token}` ({flag}): {e}"
+            return f"{status} - {(time.perf_counter() - start) * 1000:.0f} ms"
+
+        results = await asyncio.gather(*(deliver(token, flag) for token, flag in targets))
+        delivered = sum(1 for line in results if line.startswith("✅"))
+        header = f"**Announcement fan-out**: {delivered}/{len(targets)} delivered " \
+                 f"in {(time.perf_counter() - start) * 1000:.0f} ms\n"
+        for chunk in chunk_lines(results, header):
+            await ctx.send(chunk)
+
+    except Exception as e:
+        await ctx.send(f"❌ Error: {e}")
+
 @bot.command()
 @requires_level(8)
 @commands.has_permissions(manage_messages=True)
@@ -284,8 +665,7 @@ async def clear(ctx, amount: str):
             count = int(amount)
             deleted = await ctx.channel.purge(limit=count)
             confirmation = await ctx.send(f"🧹 Deleted {len(deleted)} messages.")
-        await asyncio.sleep(3)
-        await confirmation.delete()
+        outbound.delete_later(confirmation, 3)
     except Exception as e:
         await ctx.send(f"❌ Failed to clear messages: {e}")
     except Exception as e:
@@ -304,6 +684,174 @@ def get_guild_config(guild_id):
         return config.get(str(guild_id), {})
     except FileNotFoundError:
         return {}
+
+# --- Bug forum full-text index ---
+# Messages are stored with rowid = message id and thread titles with rowid = -thread id. A forum
+# post's starter message shares its thread's id, so the sign keeps the two rows apart while both
+# can still be upserted or removed individually as events arrive.
+BUG_INDEX_FILE = "bug_index.db"
+
+bug_index = sqlite3.connect(BUG_INDEX_FILE)
+bug_index.executescript("""
+    CREATE TABLE IF NOT EXISTS bug_threads (
+        thread_id INTEGER PRIMARY KEY,
+        guild_id INTEGER NOT NULL,
+        name TEXT NOT NULL
+    );
+    CREATE VIRTUAL TABLE IF NOT EXISTS bug_messages USING fts5(
+        guild_id UNINDEXED, thread_id UNINDEXED, title, body, tokenize='porter unicode61'
+    );
+""")
+
+def is_indexed_forum_thread(channel):
+    if not isinstance(channel, discord.Thread) or not isinstance(channel.parent, discord.ForumChannel):
+        return False
+    return str(channel.parent_id) == str(get_guild_config(channel.guild.id).get("forumChannelId"))
+
+def index_thread_meta(thread: discord.Thread):
+    with bug_index:
+        bug_index.execute("INSERT OR REPLACE INTO bug_threads (thread_id, guild_id, name) VALUES (?, ?, ?)",
+                          (thread.id, thread.guild.id, thread.name))
+        bug_index.execute("INSERT OR REPLACE INTO bug_messages (rowid, guild_id, thread_id, title, body) "
+                          "VALUES (?, ?, ?, ?, '')", (-thread.id, thread.guild.id, thread.id, thread.name))
+
+def ensure_thread_meta(thread: discord.Thread):
+    # Cheap enough for every live message; covers threads created before deploy or while offline
+    with bug_index:
+        inserted = bug_index.execute("INSERT OR IGNORE INTO bug_threads (thread_id, guild_id, name) VALUES (?, ?, ?)",
+                                     (thread.id, thread.guild.id, thread.name)).rowcount
+        if inserted:
+            bug_index.execute("INSERT OR REPLACE INTO bug_messages (rowid, guild_id, thread_id, title, body) "
+                              "VALUES (?, ?, ?, ?, '')", (-thread.id, thread.guild.id, thread.id, thread.name))
+
+def index_message(message: discord.Message, commit=True):
+    body = message.content or ""
+    attachments = " ".join(a.filename for a in message.attachments)
+    if attachments:
+        body = f"{body}\n{attachments}"
+    bug_index.execute("INSERT OR REPLACE INTO bug_messages (rowid, guild_id, thread_id, title, body) "
+                      "VALUES (?, ?, ?, '', ?)", (message.id, message.guild.id, message.channel.id, body))
+    if commit:
+        bug_index.commit()
+
+def index_thread(thread: discord.Thread, messages: list[discord.Message]):
+    index_thread_meta(thread)
+    with bug_index:
+        for msg in messages:
+            index_message(msg, commit=False)
+
+def remove_from_index(thread_id=None, message_id=None):
+    with bug_index:
+        if message_id:
+            bug_index.execute("DELETE FROM bug_messages WHERE rowid = ?", (message_id,))
+        if thread_id:
+            bug_index.execute("DELETE FROM bug_messages WHERE thread_id = ?", (thread_id,))
+            bug_index.execute("DELETE FROM bug_threads WHERE thread_id = ?", (thread_id,))
+
+def build_fts_query(text, operator="AND"):
+    terms = re.findall(r"\w+", text.lower())
+    return f" {operator} ".join(f'"{term}"' for term in terms)
+
+def search_bug_index(guild_id, query, limit=10, exclude_thread_id=0):
+    # Titles weigh five times as much as message bodies; a thread ranks by its best matching row
+    if not query:
+        return []
+    return bug_index.execute("""
+        SELECT m.thread_id, t.name, min(m.score) AS score
+        FROM (
+            SELECT thread_id, bm25(bug_messages, 0.0, 0.0, 5.0, 1.0) AS score
+            FROM bug_messages
+            WHERE bug_messages MATCH ? AND guild_id = ?
+            ORDER BY score LIMIT -1
+        ) AS m
+        JOIN bug_threads AS t ON t.thread_id = m.thread_id
+        WHERE m.thread_id != ?
+        GROUP BY m.thread_id
+        ORDER BY score
+        LIMIT ?
+    """, (query, guild_id, exclude_thread_id, limit)).fetchall()
+
+# Words too common in bug titles to say anything about whether two reports match
+TITLE_STOPWORDS = {
+    "the", "and", "when", "with", "for", "not", "from", "after", "while", "that", "this", "does",
+    "doesn", "can", "cant", "won", "into", "off", "are", "was", "has", "have", "get", "getting",
+    "bug", "issue", "problem", "error", "sometimes", "randomly", "some", "any", "all", "will",
+}
+
+def find_duplicate_threads(thread: discord.Thread, limit=3):
+    # Compare titles only, and require at least two significant title words in common:
+    # a single shared word is far too weak to call two reports duplicates
+    terms = sorted({term for term in re.findall(r"\w+", thread.name.lower())
+                    if len(term) > 2 and term not in TITLE_STOPWORDS})
+    if len(terms) < 2:
+        return []
+    pairs = [f'("{a}" AND "{b}")' for i, a in enumerate(terms) for b in terms[i + 1:]]
+    return search_bug_index(thread.guild.id, f"title : ({' OR '.join(pairs)})", limit,
+                            exclude_thread_id=thread.id)
+
+def format_duplicate_warning(thread: discord.Thread, duplicates):
+    links = ", ".join(f"[{name}](https://discord.com/channels/{thread.guild.id}/{thread_id})"
+                      for thread_id, name, _ in duplicates)
+    return f"⚠️ Possible duplicates of **{thread.name}**: {links}"
+
+@bot.event
+async def on_raw_message_edit(payload):
+    # Raw so edits to uncached older messages are picked up; embed-only updates carry no content
+    if "content" not in payload.data:
+        return
+    channel = bot.get_channel(payload.channel_id)
+    if is_indexed_forum_thread(channel):
+        try:
+            index_message(await channel.fetch_message(payload.message_id))
+        except discord.HTTPException as e:
+            print(f"⚠️ Could not reindex edited message {payload.message_id}: {e}")
+
+@bot.event
+async def on_raw_message_delete(payload):
+    remove_from_index(message_id=payload.message_id)
+
+@bot.event
+async def on_raw_bulk_message_delete(payload):
+    with bug_index:
+        bug_index.executemany("DELETE FROM bug_messages WHERE rowid = ?",
+                              [(message_id,) for message_id in payload.message_ids])
+
+@bot.event
+async def on_thread_create(thread):
+    if is_indexed_forum_thread(thread):
+        index_thread_meta(thread)
+
+@bot.event
+async def on_thread_update(before, after):
+    if before.name != after.name and is_indexed_forum_thread(after):
+        index_thread_meta(after)
+
+@bot.event
+async def on_raw_thread_delete(payload):
+    forget_translation_thread(payload.thread_id)
+    remove_from_index(thread_id=payload.thread_id)
+
+@tree.command(name="search_bugs", description="Search the bug forum threads")
+@app_commands.describe(query="Words to search for", limit="Maximum number of threads to return")
+async def search_bugs(interaction: discord.Interaction, query: str, limit: app_commands.Range[int, 1, 25] = 10):
+    start = time.perf_counter()
+    try:
+        results = search_bug_index(interaction.guild_id, build_fts_query(query), limit)
+    except sqlite3.OperationalError as e:
+        await interaction.response.send_message(f"Invalid search: {e}", ephemeral=True)
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if not results:
+        await interaction.response.send_message(f"No bug threads match `{query}`.", ephemeral=True)
+        return
+
+    lines = [f"{i}. [{name}](https://discord.com/channels/{interaction.guild_id}/{thread_id})"
+             for i, (thread_id, name, _) in enumerate(results, start=1)]
+    chunks = chunk_lines(lines, f"**{len(results)}** thread(s) for `{query}` ({elapsed:.1f} ms)\n")
+    await interaction.response.send_message(chunks[0], ephemeral=True)
+    for chunk in chunks[1:]:
+        await interaction.followup.send(chunk, ephemeral=True)
 @bot.event
 async def on_reaction_add(reaction, user):
     if user.bot or not reaction.message.guild:
@@ -335,15 +883,20 @@ async def on_reaction_add(reaction, user):
     if matched:
         try:
             messages = await fetch_thread_messages(channel)
-            jira_issue = await create_jira_issue_from_thread(channel, messages)
-
-            all_attachments = [att for msg in messages for att in msg.attachments]
-            await upload_attachments_to_jira(jira_issue["id"], all_attachments)
 
             config = get_guild_config(reaction.message.guild.id)
             log_channel_id = config.get("logChannelId")
             log_channel = bot.get_channel(int(log_channel_id)) if log_channel_id else None
 
+            duplicates = find_duplicate_threads(channel)
+            if duplicates and log_channel and isinstance(log_channel, discord.TextChannel):
+                await log_channel.send(format_duplicate_warning(channel, duplicates))
+
+            jira_issue = await create_jira_issue_from_thread(channel, messages)
+
+            all_attachments = [att for msg in messages for att in msg.attachments]
+            await upload_attachments_to_jira(jira_issue["id"], all_attachments)
+
             if log_channel and isinstance(log_channel, discord.TextChannel):
                 await log_channel.send(
                     f"Bug synced to Jira: [{jira_issue['key']}]({JIRA_BASE_URL}/browse/{jira_issue['key']})\n"
@@ -385,7 +938,10 @@ def create_zip_from_logs(files: list[dict]) -> BytesIO:
 
 
 async def fetch_thread_messages(thread: discord.Thread) -> list[discord.Message]:
-    return [msg async for msg in thread.history(limit=100, oldest_first=True)]
+    messages = [msg async for msg in thread.history(limit=100, oldest_first=True)]
+    if is_indexed_forum_thread(thread):
+        index_thread(thread, messages)
+    return messages
 
 async def create_jira_issue_from_thread(thread: discord.Thread, messages: list[discord.Message]) -> dict:
     jira_base_url = JIRA_BASE_URL
@@ -679,6 +1235,7 @@ async def end_tournament(interaction: discord.Interaction, name: str = "Unnamed
     files = []
     for thread in matched_threads:
         messages = [m async for m in thread.history(limit=100)]
+        index_thread(thread, messages)
         content = await format_thread_to_markdown(thread, messages)
         files.append({"name": f"{thread.name}.md", "content": content})
 
@@ -739,25 +1296,19 @@ async def mass_sync_jira(interaction: discord.Interaction, since: str = None):
     for thread in matched_threads:
         try:
             messages = await fetch_thread_messages(thread)
+            duplicates = find_duplicate_threads(thread)
             jira_issue = await create_jira_issue_from_thread(thread, messages)
             await upload_attachments_to_jira(jira_issue["id"], [att for msg in messages for att in msg.attachments])
             results.append(f"[{jira_issue['key']}]({JIRA_BASE_URL}/browse/{jira_issue['key']}) - {thread.name}")
+            if duplicates:
+                results.append(format_duplicate_warning(thread, duplicates))
         except Exception as e:
             print(f"Jira sync failed for {thread.name}: {e}")
             results.append(f"{thread.name}: Failed to sync")
 
     set_guild_config(interaction.guild_id, {**config, "lastJiraMassSync": now.isoformat()})
 
-    # Break large messages into chunks of 2000 characters or less
-    chunks = []
-    current_chunk = "**Jira Sync Report**\n"
-    for line in results:
-        if len(current_chunk) + len(line) + 1 > 2000:
-            chunks.append(current_chunk)
-            current_chunk = ""
-        current_chunk += line + "\n"
-    if current_chunk:
-        chunks.append(current_chunk)
+    chunks = chunk_lines(results, "**Jira Sync Report**\n")
 
     for chunk in chunks:
         await log_channel.send(chunk)